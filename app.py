@@ -1,13 +1,20 @@
 import streamlit as st
 import json
+import os
+import tempfile
 import pandas as pd
 import plotly.express as px
 from src.database.repository import ProfileRepository, Profile
-from src.search.vector_search import VectorSearch
+from src.search.vector_search import (
+    VectorSearch, EMBEDDING_BACKEND, EMBEDDING_THREADS, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_FOLDER, EMBEDDING_LOCAL_ONLY,
+)
 from src.services.chat_service import ChatService
+from src.services.snapshot_service import SnapshotService
 
 DB_PATH = "data/profiles.db"
 FAISS_INDEX_PATH = "data/profiles.faiss"
+EMBEDDINGS_PATH = "data/profiles_embeddings.npz"
 
 st.set_page_config(page_title="Smart Knowledge Repository", layout="wide")
 st.title("🤖 Smart Knowledge Repository")
@@ -15,13 +22,17 @@ st.title("🤖 Smart Knowledge Repository")
 @st.cache_resource
 def load_resources():
     repo = ProfileRepository(db_path=DB_PATH)
-    vector_search = VectorSearch()
+    vector_search = VectorSearch(
+        backend=EMBEDDING_BACKEND, num_threads=EMBEDDING_THREADS, batch_size=EMBEDDING_BATCH_SIZE,
+        cache_folder=EMBEDDING_CACHE_FOLDER, local_files_only=EMBEDDING_LOCAL_ONLY,
+    )
     vector_search.load_index(FAISS_INDEX_PATH)
     chat_service = ChatService(repo, vector_search)
-    return repo, chat_service, vector_search
+    snapshot_service = SnapshotService(repo, vector_search, FAISS_INDEX_PATH, EMBEDDINGS_PATH)
+    return repo, chat_service, vector_search, snapshot_service
 
 try:
-    repo, chat_service, vector_search = load_resources()
+    repo, chat_service, vector_search, snapshot_service = load_resources()
 except Exception as e:
     st.error(f"An error occurred during initialization: {e}")
     st.info("Please make sure you have run `create_index.py` and have a valid `.streamlit/secrets.toml` file.")
@@ -94,12 +105,51 @@ with admin_tab:
             st.warning("⚠️ Warning: Importing will overwrite all existing data in the database.")
             if st.button("Confirm and Import Data"):
                 repo.import_from_json_data(new_data)
+                # Imported rows get new ids, so the stored embeddings no longer line up with the database
+                snapshot_service.discard_embeddings()
                 st.success("Successfully imported data from file.")
-                st.info("Important: You must run `create_index.py` again to update the semantic search with the new data.")
+                st.info("Important: You must run `create_index.py` again to update the semantic search and enable snapshots.")
                 st.experimental_rerun()
         except Exception as e:
             st.error(f"An error occurred during import: {e}")
 
+    st.subheader("Binary Snapshot")
+    st.caption("Snapshots bundle the database, embeddings and search index, so restoring does not require re-indexing.")
+
+    # Snapshot Export
+    if st.button("Prepare Snapshot"):
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                snapshot_path = os.path.join(tmp_dir, "knowledge_base.snapshot")
+                snapshot_service.create_snapshot(snapshot_path)
+                with open(snapshot_path, "rb") as f:
+                    st.session_state.snapshot_bytes = f.read()
+        except Exception as e:
+            st.error(f"Could not create snapshot: {e}")
+    if "snapshot_bytes" in st.session_state:
+        st.download_button(
+            label="📦 Download Snapshot",
+            file_name="knowledge_base.snapshot",
+            mime="application/zip",
+            data=st.session_state.snapshot_bytes,
+        )
+
+    # Snapshot Restore
+    uploaded_snapshot = st.file_uploader("Restore Knowledge Base from Snapshot", type=["snapshot", "zip"])
+    if uploaded_snapshot is not None:
+        st.warning("⚠️ Warning: Restoring will replace the database and search index.")
+        if st.button("Confirm and Restore Snapshot"):
+            try:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    snapshot_path = os.path.join(tmp_dir, "upload.snapshot")
+                    with open(snapshot_path, "wb") as f:
+                        f.write(uploaded_snapshot.getbuffer())
+                    manifest = snapshot_service.restore_snapshot(snapshot_path)
+                st.success(f"Restored snapshot with {manifest['vector_count']} indexed profiles.")
+                st.experimental_rerun()
+            except Exception as e:
+                st.error(f"An error occurred during restore: {e}")
+
 with analytics_tab:
     st.header("Knowledge Base Analytics")
     
@@ -117,4 +167,12 @@ with analytics_tab:
         st.subheader("Raw Data View")
         st.dataframe(df)
     else:
-        st.warning("No data in the knowledge base to analyze.")
\ No newline at end of file
+        st.warning("No data in the knowledge base to analyze.")
+
+    st.subheader("Profile Cache")
+    cache_stats = repo.get_cache_stats()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Cached Profiles", f"{cache_stats['size']} / {cache_stats['max_size']}")
+    col2.metric("Hits", cache_stats['hits'])
+    col3.metric("Misses", cache_stats['misses'])
+    col4.metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
\ No newline at end of file
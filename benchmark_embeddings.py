@@ -0,0 +1,88 @@
+import os
+import time
+import torch
+from src.database.repository import ProfileRepository
+from src.search.vector_search import (
+    VectorSearch, SUPPORTED_BACKENDS, EMBEDDING_BACKEND, EMBEDDING_THREADS, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_FOLDER, EMBEDDING_LOCAL_ONLY,
+)
+
+DB_PATH = "data/profiles.db"
+# Grid of settings to try; the shipped EMBEDDING_THREADS/EMBEDDING_BATCH_SIZE are always included
+THREAD_OPTIONS = [1, 2, 4]
+BATCH_SIZE_OPTIONS = [16, 64]
+MIN_COSINE = 0.99
+LATENCY_RUNS = 50
+SAMPLE_QUERY = "Who is the CEO of Amzur?"
+
+def load_texts() -> list:
+    """Uses the profiles in the database as the benchmark corpus, padded to a useful size."""
+    texts = []
+    # Check first, since connecting to a missing path would silently create an empty database
+    if os.path.exists(DB_PATH):
+        texts = [p['content'] for p in ProfileRepository(db_path=DB_PATH).get_all_profiles_for_indexing()]
+    if not texts:
+        texts = [f"{SAMPLE_QUERY} Leadership profile number {i}." for i in range(32)]
+    while len(texts) < 512:
+        texts = texts + texts
+    return texts[:512]
+
+def settings_grid(default_threads: int) -> tuple:
+    """Returns the thread and batch size options, starting with the shipped settings."""
+    shipped_threads = EMBEDDING_THREADS or default_threads
+    threads = [shipped_threads] + [t for t in THREAD_OPTIONS if t != shipped_threads]
+    batch_sizes = [EMBEDDING_BATCH_SIZE] + [b for b in BATCH_SIZE_OPTIONS if b != EMBEDDING_BATCH_SIZE]
+    return threads, batch_sizes
+
+def run_benchmark():
+    """
+    Reports encode throughput and single-query latency for each embedding backend across a grid
+    of thread and batch size settings, and checks every backend against the stock PyTorch model.
+    """
+    print("--- Starting Embedding Benchmark ---")
+    texts = load_texts()
+    # torch.set_num_threads is process-wide, so resolve "default" before any backend changes it
+    threads_options, batch_size_options = settings_grid(torch.get_num_threads())
+    cache_settings = {"cache_folder": EMBEDDING_CACHE_FOLDER, "local_files_only": EMBEDDING_LOCAL_ONLY}
+    baseline = VectorSearch(backend="torch", num_threads=threads_options[0], batch_size=EMBEDDING_BATCH_SIZE, **cache_settings)
+    print(f"Shipped settings: backend={EMBEDDING_BACKEND}, threads={EMBEDDING_THREADS}, batch_size={EMBEDDING_BATCH_SIZE}")
+
+    for backend in SUPPORTED_BACKENDS:
+        tolerance = None
+        for num_threads in threads_options:
+            try:
+                # Threads are fixed when the model or session is created, so reload per setting
+                vector_search = VectorSearch(backend=backend, num_threads=num_threads, **cache_settings)
+            except Exception as e:
+                # Missing optional dependencies surface as ImportError or a plain Exception from sentence-transformers
+                print(f"[{backend}] skipped, could not load backend: {e}")
+                break
+
+            # Warm up once so model loading and graph setup are not measured
+            vector_search.model.encode([SAMPLE_QUERY])
+
+            start = time.perf_counter()
+            for _ in range(LATENCY_RUNS):
+                vector_search.model.encode([SAMPLE_QUERY], batch_size=1)
+            latency_ms = (time.perf_counter() - start) / LATENCY_RUNS * 1000
+
+            for batch_size in batch_size_options:
+                vector_search.batch_size = batch_size
+                start = time.perf_counter()
+                vector_search.create_embeddings(texts, show_progress_bar=False)
+                throughput = len(texts) / (time.perf_counter() - start)
+                print(f"[{backend}] threads={num_threads} batch={batch_size}: "
+                      f"{throughput:.1f} texts/s, {latency_ms:.2f} ms/query")
+
+            if tolerance is None:
+                try:
+                    worst = vector_search.check_tolerance(baseline, texts[:64], min_cosine=MIN_COSINE)
+                    tolerance = f"min cosine {worst:.4f}"
+                except ValueError as e:
+                    tolerance = f"FAILED ({e})"
+                print(f"[{backend}] tolerance vs torch: {tolerance}")
+
+    print("--- Embedding Benchmark Finished ---")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -1,8 +1,12 @@
 from src.database.repository import ProfileRepository
-from src.search.vector_search import VectorSearch
+from src.search.vector_search import (
+    VectorSearch, EMBEDDING_BACKEND, EMBEDDING_THREADS, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_FOLDER, EMBEDDING_LOCAL_ONLY,
+)
 
 DB_PATH = "data/profiles.db"
 FAISS_INDEX_PATH = "data/profiles.faiss"
+EMBEDDINGS_PATH = "data/profiles_embeddings.npz"
 
 def run_indexing_pipeline():
     """
@@ -21,9 +25,13 @@ def run_indexing_pipeline():
     contents = [p['content'] for p in profiles_to_index]
     db_ids = [p['id'] for p in profiles_to_index]
 
-    vector_search = VectorSearch()
+    vector_search = VectorSearch(
+        backend=EMBEDDING_BACKEND, num_threads=EMBEDDING_THREADS, batch_size=EMBEDDING_BATCH_SIZE,
+        cache_folder=EMBEDDING_CACHE_FOLDER, local_files_only=EMBEDDING_LOCAL_ONLY,
+    )
     embeddings = vector_search.create_embeddings(contents)
     vector_search.create_and_save_index(embeddings, db_ids, FAISS_INDEX_PATH)
+    vector_search.save_embeddings(embeddings, db_ids, EMBEDDINGS_PATH)
     
     print("--- Vector Indexing Pipeline Finished ---")
 
@@ -1,19 +1,33 @@
 import sqlite3
-from pydantic import BaseModel
-from typing import List, Optional
+import threading
+from collections import OrderedDict
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, List, Optional
 import numpy as np
 
-# The Profile class remains the same
+# Profiles are frozen so cached instances can be shared safely between callers
 class Profile(BaseModel):
     name: str
     role: str
     bio: Optional[str] = ""
     photo_url: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 class ProfileRepository:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, cache_size: int = 256):
         # We only store the path now, we don't connect here.
         self.db_path = db_path
+        # Bounded LRU cache of Profile objects keyed by database ID; None marks an ID known to be missing
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[int, Optional[Profile]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped on every invalidation so in-flight fetches never write back stale rows
+        self._cache_generation = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_negative_hits = 0
+        self._cache_evictions = 0
 
     def _get_connection(self):
         """Helper method to create a new connection."""
@@ -57,6 +71,7 @@ class ProfileRepository:
                 VALUES (?, ?, ?, ?)
                 ''', (rowid, profile.name, profile.role, profile.bio))
                 conn.commit()
+                self.invalidate_profile(rowid)
             except sqlite3.IntegrityError:
                 print(f"Profile for {profile.name} already exists. Skipping.")
 
@@ -96,32 +111,96 @@ class ProfileRepository:
                 for row in rows
             ]
 
+    def _get_cached_profiles(self, id_list: List[int]) -> Dict[int, Profile]:
+        """Returns profiles for the given IDs, fetching all cache misses in a single query."""
+        profile_map = {}
+        missing_ids = []
+        with self._cache_lock:
+            generation = self._cache_generation
+            for profile_id in id_list:
+                # FAISS pads results with -1 when fewer than top_k vectors match
+                if profile_id < 0:
+                    continue
+                if profile_id in self._cache:
+                    self._cache.move_to_end(profile_id)
+                    profile = self._cache[profile_id]
+                    if profile is not None:
+                        profile_map[profile_id] = profile
+                        self._cache_hits += 1
+                    else:
+                        self._cache_negative_hits += 1
+                else:
+                    if profile_id not in missing_ids:
+                        missing_ids.append(profile_id)
+                    self._cache_misses += 1
+
+        if not missing_ids:
+            return profile_map
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            placeholders = ', '.join('?' for _ in missing_ids)
+            query = f"SELECT id, name, role, bio, photo_url FROM profiles WHERE id IN ({placeholders})"
+            cursor.execute(query, missing_ids)
+            rows = cursor.fetchall()
+
+        fetched = {
+            row["id"]: Profile(name=row["name"], role=row["role"], bio=row["bio"], photo_url=row["photo_url"])
+            for row in rows
+        }
+        profile_map.update(fetched)
+
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                # A write happened while we were reading, so these rows may already be stale
+                return profile_map
+            for profile_id in missing_ids:
+                self._cache[profile_id] = fetched.get(profile_id)
+                self._cache.move_to_end(profile_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
+        return profile_map
+
     def get_profiles_by_ids(self, ids: np.ndarray) -> List[Profile]:
         """Retrieves specific profiles by their IDs, preserving order."""
         if not ids.any():
             return []
         
         id_list = ids.tolist() # Convert numpy array to list for the query
-
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ', '.join('?' for _ in id_list)
-            query = f"SELECT id, name, role, bio, photo_url FROM profiles WHERE id IN ({placeholders})"
-            cursor.execute(query, id_list)
-            rows = cursor.fetchall()
-            
-            profile_map = {row["id"]: Profile(**dict(row)) for row in rows}
-            ordered_profiles = [profile_map[id] for id in id_list if id in profile_map]
-            return ordered_profiles
+        profile_map = self._get_cached_profiles(id_list)
+        return [profile_map[id] for id in id_list if id in profile_map]
         
     
     def get_profile_by_id(self, profile_id: int) -> Optional[Profile]:
         """Retrieves a single profile by its primary key ID."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT name, role, bio, photo_url FROM profiles WHERE id = ?", (profile_id,))
-            row = cursor.fetchone()
-            return Profile(**row) if row else None
+        return self._get_cached_profiles([profile_id]).get(profile_id)
+
+    def invalidate_profile(self, profile_id: int):
+        """Removes a single profile from the cache."""
+        with self._cache_lock:
+            self._cache.pop(profile_id, None)
+            self._cache_generation += 1
+
+    def clear_cache(self):
+        """Removes every profile from the cache, e.g. after a bulk import or restore."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
+
+    def get_cache_stats(self) -> dict:
+        """Returns hit, miss and eviction counts for the profile cache. Lookups of known-missing ids are reported separately."""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "negative_hits": self._cache_negative_hits,
+                "evictions": self._cache_evictions,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            }
 
     def update_profile(self, profile_id: int, profile: Profile):
         """Updates an existing profile in the database."""
@@ -137,6 +216,7 @@ class ProfileRepository:
             WHERE rowid=?
             ''', (profile.name, profile.role, profile.bio, profile_id))
             conn.commit()
+        self.invalidate_profile(profile_id)
 
     def delete_profile(self, profile_id: int):
         """Deletes a profile from the database."""
@@ -145,6 +225,7 @@ class ProfileRepository:
             cursor.execute("DELETE FROM profiles WHERE id=?", (profile_id,))
             cursor.execute("DELETE FROM profiles_fts WHERE rowid=?", (profile_id,))
             conn.commit()
+        self.invalidate_profile(profile_id)
 
      # --- NEW METHODS FOR MILESTONE 5 ---
     def get_all_profiles_as_dicts(self) -> List[dict]:
@@ -179,4 +260,14 @@ class ProfileRepository:
                 except sqlite3.IntegrityError:
                     print(f"Skipping duplicate profile on import: {profile.name}")
             
-            conn.commit()
\ No newline at end of file
+            conn.commit()
+        self.clear_cache()
+
+    def backup_to(self, dest_path: str):
+        """Writes a consistent copy of the database to dest_path using SQLite's online backup API."""
+        with self._get_connection() as src:
+            dest = sqlite3.connect(dest_path)
+            try:
+                src.backup(dest)
+            finally:
+                dest.close()
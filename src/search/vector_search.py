@@ -1,20 +1,84 @@
 import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
-from typing import List
+from typing import List, Optional
+
+SUPPORTED_BACKENDS = ("torch", "onnx", "quantized")
+
+# Shared embedding settings: the index and the queries must be encoded by the same backend
+EMBEDDING_BACKEND = "torch"
+EMBEDDING_THREADS = None
+EMBEDDING_BATCH_SIZE = 32
+# Models are cached here; set EMBEDDING_LOCAL_ONLY to True once cached to skip the Hub at startup
+EMBEDDING_CACHE_FOLDER = "data/models"
+EMBEDDING_LOCAL_ONLY = False
 
 class VectorSearch:
-    def __init__(self, model_name='all-MiniLM-L6-v2'):
-        """Initializes the model for creating vector embeddings."""
-        self.model = SentenceTransformer(model_name)
+    def __init__(self, model_name='all-MiniLM-L6-v2', backend: str = "torch", num_threads: Optional[int] = None,
+                 batch_size: int = 32, cache_folder: Optional[str] = None, local_files_only: bool = False):
+        """
+        Initializes the model for creating vector embeddings.
+        backend selects the CPU inference path: stock PyTorch ("torch"), ONNX Runtime ("onnx")
+        or PyTorch with dynamic int8 quantization of the Linear layers ("quantized").
+        """
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"Unsupported backend '{backend}'. Choose one of {SUPPORTED_BACKENDS}.")
+        self.model_name = model_name
+        self.backend = backend
+        self.num_threads = num_threads
+        self.batch_size = batch_size
+        self.model = self._load_model(cache_folder, local_files_only)
         self.index = None
 
-    def create_embeddings(self, texts: List[str]) -> np.ndarray:
+    def _load_model(self, cache_folder: Optional[str], local_files_only: bool) -> SentenceTransformer:
+        """Loads the SentenceTransformer for the configured backend and thread count."""
+        if self.backend == "onnx":
+            import onnxruntime as ort
+            session_options = ort.SessionOptions()
+            if self.num_threads:
+                session_options.intra_op_num_threads = self.num_threads
+            return SentenceTransformer(
+                self.model_name, device="cpu", backend="onnx", cache_folder=cache_folder,
+                local_files_only=local_files_only,
+                model_kwargs={"provider": "CPUExecutionProvider", "session_options": session_options},
+            )
+
+        import torch
+        if self.num_threads:
+            torch.set_num_threads(self.num_threads)
+        model = SentenceTransformer(
+            self.model_name, device="cpu", cache_folder=cache_folder, local_files_only=local_files_only
+        )
+        if self.backend == "quantized":
+            torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        return model
+
+    def create_embeddings(self, texts: List[str], show_progress_bar: bool = True) -> np.ndarray:
         """Converts a list of texts into a matrix of vector embeddings."""
         print("Creating text embeddings...")
-        embeddings = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
+        embeddings = self.model.encode(
+            texts, batch_size=self.batch_size, convert_to_numpy=True, show_progress_bar=show_progress_bar
+        )
         return embeddings.astype('float32') # FAISS requires float32
 
+    def check_tolerance(self, baseline: "VectorSearch", texts: List[str], min_cosine: float = 0.99) -> float:
+        """
+        Compares this model's embeddings against a baseline model on the same texts.
+        Returns the lowest cosine similarity and raises ValueError if it is below min_cosine.
+        """
+        candidate = self.create_embeddings(texts, show_progress_bar=False)
+        reference = baseline.create_embeddings(texts, show_progress_bar=False)
+        candidate /= np.clip(np.linalg.norm(candidate, axis=1, keepdims=True), 1e-12, None)
+        reference /= np.clip(np.linalg.norm(reference, axis=1, keepdims=True), 1e-12, None)
+        worst = float(np.min(np.sum(candidate * reference, axis=1)))
+        # Written so that a NaN similarity fails the check instead of slipping through
+        if not worst >= min_cosine:
+            raise ValueError(
+                f"Backend '{self.backend}' drifted from '{baseline.backend}': "
+                f"minimum cosine similarity {worst:.4f} is below {min_cosine}."
+            )
+        return worst
+
     def create_and_save_index(self, embeddings: np.ndarray, db_ids: List[int], file_path: str):
         """Builds a FAISS index that maps vectors to their database IDs and saves it."""
         print(f"Creating FAISS index for {len(embeddings)} vectors...")
@@ -31,6 +95,12 @@ class VectorSearch:
         print(f"Saving index to {file_path}...")
         faiss.write_index(self.index, file_path)
 
+    def save_embeddings(self, embeddings: np.ndarray, db_ids: List[int], file_path: str):
+        """Saves the raw embeddings and their database IDs so they can be bundled into snapshots."""
+        print(f"Saving embeddings to {file_path}...")
+        with open(file_path, 'wb') as f:
+            np.savez(f, embeddings=embeddings, ids=np.array(db_ids).astype('int64'))
+
     def load_index(self, file_path: str):
         """Loads a pre-built FAISS index from a file."""
         print(f"Loading FAISS index from {file_path}...")
@@ -44,6 +114,6 @@ class VectorSearch:
         if self.index is None:
             raise RuntimeError("Index is not loaded. Please load an index before searching.")
             
-        query_vector = self.model.encode([query_text]).astype('float32')
+        query_vector = self.model.encode([query_text], batch_size=1).astype('float32')
         distances, db_ids = self.index.search(query_vector, top_k)
         return distances[0], db_ids[0]
\ No newline at end of file
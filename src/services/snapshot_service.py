@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+import tempfile
+import zipfile
+from datetime import datetime, timezone
+import faiss
+import numpy as np
+from src.database.repository import ProfileRepository
+from src.search.vector_search import VectorSearch
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+DB_NAME = "profiles.db"
+INDEX_NAME = "profiles.faiss"
+EMBEDDINGS_NAME = "profiles_embeddings.npz"
+REQUIRED_MANIFEST_KEYS = ("format_version", "model_name", "backend", "dimension", "vector_count", "has_embeddings")
+
+class SnapshotService:
+    """
+    Bundles the database, stored embeddings and FAISS index into a single binary
+    snapshot, and restores them with a file-level swap instead of a full re-embed.
+    """
+    def __init__(self, repo: ProfileRepository, search: VectorSearch, index_path: str, embeddings_path: str):
+        self.repo = repo
+        self.search = search
+        self.index_path = index_path
+        self.embeddings_path = embeddings_path
+
+    def create_snapshot(self, dest_path: str) -> dict:
+        """Writes a snapshot archive to dest_path and returns its manifest."""
+        # Reload from disk so an index rebuilt by `create_index.py` is picked up without restarting the app
+        self.search.load_index(self.index_path)
+        index = self.search.index
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_copy = os.path.join(tmp_dir, DB_NAME)
+            self.repo.backup_to(db_copy)
+
+            # The index must describe the database copy, otherwise the snapshot would pair ids with the wrong profiles
+            db_ids = self._read_db_ids(db_copy)
+            if self._index_ids(index) != db_ids:
+                raise RuntimeError("The search index is out of date with the database. Please run `create_index.py` first.")
+            has_embeddings = os.path.exists(self.embeddings_path)
+            if has_embeddings:
+                with np.load(self.embeddings_path) as data:
+                    if set(data["ids"].tolist()) != db_ids:
+                        raise RuntimeError("Stored embeddings are out of date with the database. Please run `create_index.py` first.")
+
+            # Archive exactly the index that was checked, rather than re-reading a file that may have changed
+            index_copy = os.path.join(tmp_dir, INDEX_NAME)
+            faiss.write_index(index, index_copy)
+
+            manifest = {
+                "format_version": SNAPSHOT_FORMAT_VERSION,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "model_name": self.search.model_name,
+                "backend": self.search.backend,
+                "dimension": int(index.d),
+                "vector_count": int(index.ntotal),
+                "has_embeddings": has_embeddings,
+            }
+
+            # The files are already binary, so store them uncompressed to keep restores fast
+            with zipfile.ZipFile(dest_path, "w", compression=zipfile.ZIP_STORED) as archive:
+                archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+                archive.write(db_copy, DB_NAME)
+                archive.write(index_copy, INDEX_NAME)
+                if manifest["has_embeddings"]:
+                    archive.write(self.embeddings_path, EMBEDDINGS_NAME)
+
+        print(f"Snapshot with {manifest['vector_count']} vectors written to {dest_path}.")
+        return manifest
+
+    def restore_snapshot(self, src_path: str) -> dict:
+        """Validates a snapshot archive, swaps its files into place and reloads the index."""
+        # Extract next to the live files so the final os.replace stays on one filesystem
+        target_dir = os.path.dirname(os.path.abspath(self.repo.db_path))
+        with tempfile.TemporaryDirectory(dir=target_dir) as tmp_dir:
+            with zipfile.ZipFile(src_path) as archive:
+                manifest = json.loads(archive.read(MANIFEST_NAME))
+                self._validate_manifest(manifest)
+                members = [DB_NAME, INDEX_NAME] + ([EMBEDDINGS_NAME] if manifest["has_embeddings"] else [])
+                missing = [name for name in members if name not in archive.namelist()]
+                if missing:
+                    raise ValueError(f"Snapshot is missing required files: {', '.join(missing)}")
+                for name in members:
+                    archive.extract(name, tmp_dir)
+
+            # Check everything against the manifest before touching the live files
+            index = faiss.read_index(os.path.join(tmp_dir, INDEX_NAME))
+            if index.d != manifest["dimension"] or index.ntotal != manifest["vector_count"]:
+                raise ValueError("Snapshot index does not match the manifest dimension or vector count.")
+            db_ids = self._read_db_ids(os.path.join(tmp_dir, DB_NAME))
+            if self._index_ids(index) != db_ids:
+                raise ValueError("Snapshot index ids do not match the profiles in its database.")
+            if manifest["has_embeddings"]:
+                with np.load(os.path.join(tmp_dir, EMBEDDINGS_NAME)) as data:
+                    if data["embeddings"].shape != (manifest["vector_count"], manifest["dimension"]):
+                        raise ValueError("Snapshot embeddings do not match the manifest dimension or vector count.")
+                    if set(data["ids"].tolist()) != db_ids:
+                        raise ValueError("Snapshot embedding ids do not match the profiles in its database.")
+
+            print(f"Restoring snapshot with {manifest['vector_count']} vectors...")
+            swaps = [(DB_NAME, self.repo.db_path), (INDEX_NAME, self.index_path)]
+            if manifest["has_embeddings"]:
+                swaps.append((EMBEDDINGS_NAME, self.embeddings_path))
+            elif os.path.exists(self.embeddings_path):
+                # No replacement in the snapshot, so the live embeddings would be stale; back them up and drop them
+                swaps.append((None, self.embeddings_path))
+            self._swap_files(tmp_dir, swaps)
+        self.repo.clear_cache()
+
+        self.search.index = index
+        return manifest
+
+    def _swap_files(self, tmp_dir: str, swaps: list):
+        """
+        Moves the extracted files over the live ones. Live files are kept as .bak until every
+        replace has succeeded, and are put back if any step fails so the set stays consistent.
+        """
+        backups = []
+        try:
+            for name, live_path in swaps:
+                if os.path.exists(live_path):
+                    os.replace(live_path, live_path + ".bak")
+                    backups.append(live_path)
+                if name is not None:
+                    os.replace(os.path.join(tmp_dir, name), live_path)
+        except Exception:
+            print("Restore failed, rolling back to the previous files...")
+            for name, live_path in swaps:
+                if live_path in backups:
+                    os.replace(live_path + ".bak", live_path)
+                elif name is not None and os.path.exists(live_path):
+                    os.remove(live_path)
+            raise
+        for live_path in backups:
+            os.remove(live_path + ".bak")
+
+    def _index_ids(self, index) -> set:
+        """Returns the database ids stored in an IndexIDMap."""
+        if not isinstance(index, faiss.IndexIDMap):
+            raise ValueError("Index does not map vectors to database ids. Please rebuild it with `create_index.py`.")
+        return set(faiss.vector_to_array(index.id_map).tolist())
+
+    def _read_db_ids(self, db_path: str) -> set:
+        """Checks that a database file has the expected schema and returns its profile ids."""
+        conn = sqlite3.connect(db_path)
+        try:
+            if conn.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+                raise ValueError("Snapshot database failed the SQLite integrity check.")
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            missing = {"profiles", "profiles_fts"} - tables
+            if missing:
+                raise ValueError(f"Snapshot database is missing tables: {', '.join(sorted(missing))}")
+            return {row[0] for row in conn.execute("SELECT id FROM profiles")}
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Snapshot database could not be read: {e}") from e
+        finally:
+            conn.close()
+
+    def discard_embeddings(self):
+        """Removes stored embeddings that no longer match the database, e.g. after a JSON import."""
+        if os.path.exists(self.embeddings_path):
+            os.remove(self.embeddings_path)
+
+    def _validate_manifest(self, manifest: dict):
+        """Rejects snapshots that this version cannot restore or that were built with another model or backend."""
+        missing = [key for key in REQUIRED_MANIFEST_KEYS if key not in manifest]
+        if missing:
+            raise ValueError(f"Snapshot manifest is missing required keys: {', '.join(missing)}")
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {manifest.get('format_version')}")
+        if manifest.get("model_name") != self.search.model_name:
+            raise ValueError(
+                f"Snapshot was built with '{manifest.get('model_name')}', "
+                f"but the current model is '{self.search.model_name}'."
+            )
+        if manifest["backend"] != self.search.backend:
+            raise ValueError(
+                f"Snapshot was built with the '{manifest['backend']}' backend, "
+                f"but the current backend is '{self.search.backend}'."
+            )
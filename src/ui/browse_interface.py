@@ -1,6 +1,9 @@
 import streamlit as st
 from src.database.repository import ProfileRepository, Profile
-from src.search.vector_search import VectorSearch # New import
+from src.search.vector_search import (
+    VectorSearch, EMBEDDING_BACKEND, EMBEDDING_THREADS, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_CACHE_FOLDER, EMBEDDING_LOCAL_ONLY,
+)
 from typing import List
 
 DB_PATH = "data/profiles.db"
@@ -10,7 +13,10 @@ FAISS_INDEX_PATH = "data/profiles.faiss"
 @st.cache_resource
 def load_resources():
     repo = ProfileRepository(db_path=DB_PATH)
-    vector_search = VectorSearch()
+    vector_search = VectorSearch(
+        backend=EMBEDDING_BACKEND, num_threads=EMBEDDING_THREADS, batch_size=EMBEDDING_BATCH_SIZE,
+        cache_folder=EMBEDDING_CACHE_FOLDER, local_files_only=EMBEDDING_LOCAL_ONLY,
+    )
     vector_search.load_index(FAISS_INDEX_PATH)
     return repo, vector_search
 
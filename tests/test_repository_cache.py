@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from src.database.repository import ProfileRepository, Profile
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = ProfileRepository(db_path=str(tmp_path / "profiles.db"), cache_size=2)
+    repo.create_tables()
+    for name in ("Alice", "Bob", "Carol"):
+        repo.add_profile(Profile(name=name, role="Director", bio=f"{name} bio"))
+    return repo
+
+
+def profile_ids(repo):
+    return {p["name"]: p["id"] for p in repo.get_all_profiles_for_indexing()}
+
+
+class RacingConnection:
+    """Wraps a connection so a callback runs after a SELECT has read its rows but before they are cached."""
+    def __init__(self, conn, on_fetch):
+        self.conn = conn
+        self.on_fetch = on_fetch
+
+    def __enter__(self):
+        self.conn.__enter__()
+        return self
+
+    def __exit__(self, *exc):
+        return self.conn.__exit__(*exc)
+
+    def cursor(self):
+        return RacingCursor(self.conn.cursor(), self.on_fetch)
+
+
+class RacingCursor:
+    def __init__(self, cursor, on_fetch):
+        self.cursor = cursor
+        self.on_fetch = on_fetch
+
+    def execute(self, *args):
+        return self.cursor.execute(*args)
+
+    def fetchall(self):
+        rows = self.cursor.fetchall()
+        self.on_fetch()
+        return rows
+
+
+def test_update_profile_invalidates_cached_row(repo):
+    alice_id = profile_ids(repo)["Alice"]
+    assert repo.get_profile_by_id(alice_id).role == "Director"
+
+    repo.update_profile(alice_id, Profile(name="Alice", role="CEO", bio="Alice bio"))
+
+    assert repo.get_profile_by_id(alice_id).role == "CEO"
+
+
+def test_concurrent_invalidation_does_not_refill_stale_row(repo, monkeypatch):
+    alice_id = profile_ids(repo)["Alice"]
+    original_connection = repo._get_connection
+    state = {"raced": False}
+
+    def update_during_fetch():
+        if not state["raced"]:
+            state["raced"] = True
+            monkeypatch.setattr(repo, "_get_connection", original_connection)
+            repo.update_profile(alice_id, Profile(name="Alice", role="CEO", bio="Alice bio"))
+
+    monkeypatch.setattr(repo, "_get_connection", lambda: RacingConnection(original_connection(), update_during_fetch))
+
+    # The in-flight read still returns what it saw, but must not cache it
+    assert repo.get_profile_by_id(alice_id).role == "Director"
+    assert repo.get_profile_by_id(alice_id).role == "CEO"
+
+
+def test_least_recently_used_profile_is_evicted(repo):
+    ids = profile_ids(repo)
+    repo.get_profile_by_id(ids["Alice"])
+    repo.get_profile_by_id(ids["Bob"])
+    repo.get_profile_by_id(ids["Alice"])
+    repo.get_profile_by_id(ids["Carol"])
+
+    stats = repo.get_cache_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert set(repo._cache) == {ids["Alice"], ids["Carol"]}
+
+
+def test_faiss_padding_is_skipped_and_missing_ids_are_cached(repo):
+    ids = profile_ids(repo)
+    results = np.array([ids["Bob"], 999, -1], dtype="int64")
+
+    assert [p.name for p in repo.get_profiles_by_ids(results)] == ["Bob"]
+    assert [p.name for p in repo.get_profiles_by_ids(results)] == ["Bob"]
+
+    stats = repo.get_cache_stats()
+    assert -1 not in repo._cache
+    assert stats["misses"] == 2
+    assert stats["hits"] == 1
+    assert stats["negative_hits"] == 1
+    assert stats["hit_rate"] == pytest.approx(1 / 3)